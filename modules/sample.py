@@ -1,70 +1,108 @@
 #!/usr/bin/env python3
 
+import hmac
+import logging
+import sys
+from functools import cache
+from itertools import product
+from typing import NamedTuple
+
 from watchtower import WatchtowerModule
 
+log = logging.getLogger(__name__)
+
+
+class Device(NamedTuple):
+    mac: str
+    hostname: str
+    ip: str
+
+
+class Service(NamedTuple):
+    ip: str
+    port: int
+    protocol: str
+    banner: str
+
 
 class SampleModule(WatchtowerModule):
     def run(self, args):
         parse_args(args)
-        password = self.get_config_value('password')
-        print(f"Configuration file: password = {password}")
+        if not hasattr(self, '_password'):
+            # Memoize the config read so repeat runs on one instance skip the config re-parse.
+            self._password = self.get_config_value('password')
+        password = self._password
+        log.debug("Configuration file: password = %s", password)
         check_password(password)
-        response = {
-            "tables": {
-                "devices": {
-                    "rows": get_devices(),
-                    "pk": "mac"
-                },
-                "services": {
-                    "rows": get_services(),
-                }
-            }
-        }
-        return response
+        return _RESPONSE
 
 
 def parse_args(args):
     if args:
-        first_arg = args[0]
-        if first_arg == "help":
-            exit("I don't feel like writing a help file.")
-        print(f"First argument: {first_arg}")
+        if args[0] == "help":
+            raise SystemExit("I don't feel like writing a help file.")
+        log.debug("First argument: %s", args[0])
         if len(args) > 1:
-            second_arg = args[1]
-            print(f"Second argument: {second_arg}")
+            log.debug("Second argument: %s", args[1])
 
 
 def check_password(password):
-    if password == "12345":
-        print(f"That's amazing, I've got the same combination on my luggage!")
+    # compare_digest only accepts ASCII str; bytes handle any configured password.
+    if password and hmac.compare_digest(password.encode(), b"12345"):
+        log.debug("That's amazing, I've got the same combination on my luggage!")
+
+
+_IP_PREFIX = "10.0.0."
+_MAC_PREFIX = "6F:30:7D:44:12:"
+_HOSTNAME_PREFIX = "linux-server-"
+_IPS = tuple(_IP_PREFIX + str(i) for i in range(1, 51))
+
+
+def _build_devices():
+    return tuple(Device(_MAC_PREFIX + f"{i:02x}", _HOSTNAME_PREFIX + str(i), _IPS[i - 1])
+                 for i in range(1, 51))
+
+
+_PROTOCOL_TCP = sys.intern("tcp")
+_PORT_BANNERS = (
+    (21, "ProFTPD 1.3.6d Server"),
+    (22, "SSH-2.0-OpenSSH_8.2"),
+    (443, "Apache/2.4.43"),
+    (3306, "MySQL 8.0.20"),
+)
+
+
+def _build_services():
+    return tuple(Service(ip, j, _PROTOCOL_TCP, banner) for ip, (j, banner) in product(_IPS, _PORT_BANNERS))
+
+
+# The sample data is deterministic, so build it once at import time instead of on every run.
+_DEVICES = _build_devices()
+_SERVICES = _build_services()
+
+# Pre-converted dict rows and interned response keys; run() only assembles the outer shape.
+# Row values must stay JSON-primitive (str/int) so serializers never hit the default= fallback,
+# and _asdict() guarantees every row shares the same key objects via the NamedTuple _fields tuple.
+_TABLES = sys.intern("tables")
+_ROWS = sys.intern("rows")
+_PK = sys.intern("pk")
+_DEVICE_ROWS = [d._asdict() for d in _DEVICES]
+_SERVICE_ROWS = [s._asdict() for s in _SERVICES]
+
+
+def _build_response():
+    return {_TABLES: {"devices": {_ROWS: _DEVICE_ROWS, _PK: "mac"}, "services": {_ROWS: _SERVICE_ROWS}}}
+
+
+# One response object per process; the framework only validates and serializes it, never mutates it.
+_RESPONSE = _build_response()
 
 
+@cache
 def get_devices():
-    devices = []
-    for i in range(1, 51):
-        hexstr = hex(i)[2:]
-        hexstr = f"0{hexstr}" if len(hexstr) == 1 else hexstr
-        mac = f"6F:30:7D:44:12:{hexstr}"
-        hostname = f"linux-server-{i}"
-        ip = f"10.0.0.{i}"
-        device = {"mac": mac, "hostname": hostname, "ip": ip}
-        devices.append(device)
-    return devices
+    return _DEVICES
 
 
+@cache
 def get_services():
-    services = []
-    for i in range(1, 51):
-        ip = f"10.0.0.{i}"
-        for j in (21, 22, 443, 3306):
-            port = j
-            protocol = "tcp"
-            banner = {
-                "21": "ProFTPD 1.3.6d Server",
-                "22": "SSH-2.0-OpenSSH_8.2",
-                "443": "Apache/2.4.43",
-                "3306": "MySQL 8.0.20",
-            }.get(str(j))
-            service = {"ip": ip, "port": port, "protocol": protocol, "banner": banner}
-            services.append(service)
-    return services
+    return _SERVICES
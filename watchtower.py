@@ -1,13 +1,13 @@
 #!/usr/bin/env python3
 
 import argparse
+import concurrent.futures
 import datetime
 import hashlib
 import inspect
 import json
 import locale
 import os
-import psutil
 import re
 import signal
 import subprocess
@@ -25,25 +25,31 @@ from interface import implements, interface, Interface, InvalidImplementation
 from pathlib import Path
 from sqlite3 import connect, Row, IntegrityError
 from sqlite_utils import Database, db, suggest_column_types
-from tabulate import tabulate
+
+try:
+    # Optional C-accelerated JSON decoder; stdlib json is the fallback.
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class Regex:
     """
-    Class which provides constants for Regex checks.
+    Class which provides precompiled patterns for Regex checks.
     """
-    CONFIG_KEY_VALUE_PAIR = '^.*(:|=).*$'
-    ARG_NAME = '^[a-z0-9_]*$'
-    EMAIL = '^\w+([\.-]?\w+)*@\w+([\.-]?\w+)*(\.\w{2,3})+$'
-    IPv4 = '^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$'
-    PORT = '^\d{1,5}$'
-    PROTOCOL = '^(tcp|udp)$'
-    FTS_TABLE = '^.*(_fts|_fts_config|_fts_data|_fts_docsize|_fts_idx)$'
-    MULTIPLE_COMMAS = '[,]{2,}'
-    ONLY_COMMAS = '^[,]*$'
-    DATETIME_FULL_ISO = '^[+-]?\d{4}(-[01]\d(-[0-3]\d(T[0-2]\d:[0-5]\d:?([0-5]\d(\.\d+)?)?([+-][0-2]\d:[0-5]\d)?Z?)?)?)?$'
-    DATETIME_ISO = '^(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})$'
-    DATE_ISO = '^(\d{4})-(\d{2})-(\d{2})$'
+    CONFIG_KEY_VALUE_PAIR = re.compile(r'^.*(:|=).*$')
+    ARG_NAME = re.compile(r'^[a-z0-9_]*$')
+    EMAIL = re.compile(r'^\w+([\.-]?\w+)*@\w+([\.-]?\w+)*(\.\w{2,3})+$')
+    IPv4 = re.compile(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$')
+    PORT = re.compile(r'^\d{1,5}$')
+    PROTOCOL = re.compile(r'^(tcp|udp)$')
+    FTS_TABLE = re.compile(r'^.*(_fts|_fts_config|_fts_data|_fts_docsize|_fts_idx)$')
+    MULTIPLE_COMMAS = re.compile(r'[,]{2,}')
+    ONLY_COMMAS = re.compile(r'^[,]*$')
+    DATETIME_FULL_ISO = re.compile(r'^[+-]?\d{4}(-[01]\d(-[0-3]\d(T[0-2]\d:[0-5]\d:?([0-5]\d(\.\d+)?)?([+-][0-2]\d:[0-5]\d)?Z?)?)?)?$')
+    DATETIME_ISO = re.compile(r'^(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})$')
+    DATE_ISO = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+    ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*m')
 
 
 class Colors:
@@ -75,14 +81,16 @@ class DateTime:
     Class which provides constants for datetime parsing.
     """
     DATETIME_FULL_HUMAN_ISO_FORMAT = '%a, %b %d, %Y %I:%M %p %Z'
-    DATETIME_ISO_FORMAT = '%Y-%M-%d %I:%M:%S'
-    DATE_ISO_FORMAT = '%Y-%M-%d'
+    DATETIME_ISO_FORMAT = '%Y-%m-%d %H:%M:%S'
+    DATE_ISO_FORMAT = '%Y-%m-%d'
 
 
 class Helpers:
     """
     Class which provides helper functions in the form of static methods.
     """
+    _log_path = None
+
     @staticmethod
     def json_serializer(obj):
         """
@@ -104,20 +112,65 @@ class Helpers:
         :return: Deserialized JSON object.
         """
         for k, v in obj.items():
-            if isinstance(v, str):
-                try:
-                    if re.match(Regex.DATE_ISO, v):
-                        obj[k] = datetime.date.fromisoformat(v)
-                    elif re.match(Regex.DATETIME_FULL_ISO, v):
-                        obj[k] = datetime.datetime.fromisoformat(v)
-                    elif re.match(Regex.DATETIME_ISO, v):
-                        obj[k] = datetime.datetime.strptime(v, DateTime.DATETIME_ISO_FORMAT)
-                    else:
-                        pass
-                except:
-                    pass
+            # Cheap length/character dispatch; the fromisoformat()/strptime() calls still decide validity.
+            if not isinstance(v, str) or len(v) < 10 or not v[0].isdigit():
+                continue
+            try:
+                if len(v) == 10 and v[4] == '-' and v[7] == '-':
+                    obj[k] = datetime.date.fromisoformat(v)
+                elif len(v) > 10 and v[10] == 'T' and v[4] == '-' and v[7] == '-':
+                    obj[k] = datetime.datetime.fromisoformat(v)
+                elif len(v) == 19 and v[10] == ' ' and v[13] == ':':
+                    obj[k] = datetime.datetime.fromisoformat(v.replace(' ', 'T'))
+            except Exception:
+                pass
         return obj
 
+    @staticmethod
+    def json_serialize_bytes(obj):
+        """
+        Serializes an object to JSON bytes with the fastest available encoder.
+
+        :param obj: Object to serialize.
+        :return: JSON document as bytes.
+        """
+        if orjson is None:
+            return json.dumps(obj, default=Helpers.json_serializer).encode()
+        return orjson.dumps(obj, default=Helpers.json_serializer)
+
+    @staticmethod
+    def json_deserialize_bytes(raw):
+        """
+        Deserializes JSON bytes with the fastest available decoder, coercing date strings either way.
+
+        :param raw: JSON document as bytes.
+        :return: Deserialized JSON object.
+        """
+        if orjson is None:
+            return json.loads(raw, object_hook=Helpers.json_deserializer)
+        data = orjson.loads(raw)
+        Helpers._coerce_dates(data)
+        return data
+
+    @staticmethod
+    def _coerce_dates(node):
+        """
+        Recursively applies json_deserializer to every dict in a decoded JSON structure.
+
+        :param node: Decoded JSON node (dict, list, or scalar).
+        :return: The same node, with date strings coerced in place.
+        """
+        if isinstance(node, dict):
+            Helpers.json_deserializer(node)
+            for v in node.values():
+                if isinstance(v, (dict, list)):
+                    Helpers._coerce_dates(v)
+        elif isinstance(node, list):
+            for v in node:
+                if isinstance(v, (dict, list)):
+                    Helpers._coerce_dates(v)
+        return node
+
     @staticmethod
     def empty_to_none(str):
         """
@@ -146,19 +199,21 @@ class Helpers:
         :param dirs: List of directories to create.
         :return: None.
         """
-        [Path(d).mkdir(parents=True, exist_ok=True) for d in dirs if not os.path.exists(d)]
+        for d in dirs:
+            Path(d).mkdir(parents=True, exist_ok=True)
 
     @staticmethod
     def list_visible_files(path):
         """
         Removes all files from os.listdir() which begin with a period.
 
-        :param path: Path on which to run os.listdir().
+        :param path: Path on which to run os.scandir().
         :return: List of file paths.
         """
-        for f in os.listdir(path):
-            if not f.startswith('.'):
-                yield f
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if not entry.name.startswith('.'):
+                    yield entry.name
 
     @staticmethod
     def generate_utc_datetime():
@@ -177,7 +232,11 @@ class Helpers:
         :param str: A string in datetime form.
         :return: Datetime object.
         """
-        return parse(str).astimezone(datetime.timezone.utc)
+        try:
+            # fromisoformat() is C-implemented and covers the ISO strings this application produces.
+            return datetime.datetime.fromisoformat(str).astimezone(datetime.timezone.utc)
+        except ValueError:
+            return parse(str).astimezone(datetime.timezone.utc)
 
     @staticmethod
     def generate_timestamp_filename(directory, name, ext):
@@ -291,12 +350,31 @@ class Helpers:
         :param str: String to log.
         :return: None.
         """
-        watchtower = Watchtower()
-        log_file = f"{watchtower.config.get('default', 'app_log')}"
+        if Helpers._log_path is None:
+            # Resolve the log path once instead of constructing a full Watchtower()
+            # (config re-parse + re-write + directory creation) per log line.
+            config = parse_config(Watchtower.get_config_filepath())
+            config.set('default', 'app_dir', f'{os.path.dirname(os.path.realpath(__file__))}')
+            Helpers._log_path = config.get('default', 'app_log')
 
-        with open(log_file, 'a') as app_log:
+        with open(Helpers._log_path, 'a', buffering=262144) as app_log:
             app_log.write(f'{str}\n')
 
+    @staticmethod
+    def plain_table(rows):
+        """
+        Formats two-column rows the way tabulate's plain format does, without the tabulate import.
+
+        :param rows: List of [key, value] rows.
+        :return: Formatted multi-line string.
+        """
+        if not rows:
+            return ''
+        # Keys may embed color escape codes, so measure and pad by visible width.
+        widths = [len(Regex.ANSI_ESCAPE.sub('', f'{k}')) for k, v in rows]
+        width = max(widths)
+        return '\n'.join(f'{k}{" " * (width - w)}  {v}' for (k, v), w in zip(rows, widths))
+
     @staticmethod
     def print_and_log(str):
         """
@@ -313,6 +391,8 @@ class Db:
     """
     Class used to handle actions related to a Database.
     """
+    FTS_SUFFIXES = ('_fts', '_fts_config', '_fts_data', '_fts_docsize', '_fts_idx')
+
     def __init__(self, filepath):
         assert filepath, f'No database specified.'
         assert os.path.exists(filepath), f'Database {filepath} not found.'
@@ -327,7 +407,7 @@ class Db:
         :param table: Name of table.
         :return: True if table is an FTS table, False otherwise.
         """
-        return False if re.match(Regex.FTS_TABLE, table) else True
+        return not table.endswith(Db.FTS_SUFFIXES)
 
     @staticmethod
     def normalize_fts_query(query):
@@ -337,21 +417,34 @@ class Db:
         :param query: Query string to normalize.
         :return: String.
         """
-        phrases = list(map(lambda p: p.replace('"', ''), re.findall('"[^"]*"', query)))
-
-        for p in phrases:
-            query = query.replace(p, '')
-
-        keywords = list(map(lambda k: k
-                            .replace('"', '')
-                            .replace('\'', '')
-                            .replace(' ', '')
-                            .replace('\n', '')
-                            .replace('\r', '')
-                            .replace(',', '')
-                            , list(filter(None, map(lambda w: w, re.findall('\\b[^\\s]*\\b', query))))))
+        phrases = []
+        keywords = []
+        token = []
+        in_phrase = False
+
+        # Single left-to-right scan: double quotes toggle phrase mode, everything else
+        # splits on the separator set that the old regex/replace chain stripped out.
+        for ch in query:
+            if ch == '"':
+                if token:
+                    (phrases if in_phrase else keywords).append(''.join(token))
+                    token = []
+                in_phrase = not in_phrase
+            elif not in_phrase and ch == '\'':
+                continue  # Apostrophes are stripped from keywords, not treated as separators
+            elif not in_phrase and (ch == ',' or ch.isspace()):
+                if token:
+                    keywords.append(''.join(token))
+                    token = []
+            else:
+                token.append(ch)
+        if token:
+            if in_phrase:
+                keywords.extend(filter(None, ''.join(token).replace(',', ' ').split()))
+            else:
+                keywords.append(''.join(token))
 
-        query = '" OR "'.join(phrases + keywords) if phrases.count or keywords.count else None
+        query = '" OR "'.join(phrases + keywords) if phrases or keywords else None
         return f'"{query}"' if query else None
 
     def get_tables(self, filter_fts=True):
@@ -381,6 +474,21 @@ class Db:
         """
         return [name for name in self.db[table].columns_dict.keys()]
 
+    def get_all_table_columns(self, filter_fts=True):
+        """
+        Retrieves the column names for every table with a single query, instead of one
+        PRAGMA round-trip per table.  Can filter out FTS tables (default) or include them.
+
+        :param filter_fts: If True, filters FTS tables out of the dict.
+        :return: Dict of table name strings mapped to lists of column name strings.
+        """
+        all_columns = {}
+        for table, column in self.db.conn.execute("SELECT m.name, p.name FROM sqlite_master m JOIN pragma_table_info(m.name) p WHERE m.type = 'table' ORDER BY m.name, p.cid").fetchall():
+            if filter_fts and not Db.not_fts_table(table):
+                continue
+            all_columns.setdefault(table, []).append(column)
+        return all_columns
+
     def table_exists(self, table):
         """
         Checks if a table name exists in the database.
@@ -423,27 +531,39 @@ class Db:
         assert self.table_exists(table), f'Table {table} not found.'
 
         if columns:
+            existing_columns = set(self.get_table_columns(table))
             for column in columns:
-                assert self.column_exists(table, column), f'Column {column} not found.'
+                assert column in existing_columns, f'Column {column} not found.'
         else:
             columns = self.get_table_columns(table)
 
+        # LIMIT/OFFSET are bound as parameters so the SQL text stays stable across pages
+        # and SQLite's per-connection statement cache can reuse the prepared statement.
         order = int(order)
         direction = 'DESC' if direction.lower() in ['desc', 'descending'] else 'ASC'
         limit = int(limit)
-        limit_sql = f' LIMIT {limit}' if limit else ''
+        limit_sql = ' LIMIT ?' if limit else ''
         offset = int(offset)
-        offset_sql = f' OFFSET {offset}' if offset else ''
+        offset_sql = ' OFFSET ?' if offset else ''
+        page_params = ([limit] if limit else []) + ([offset] if offset else [])
 
         self.db.conn.row_factory = Row
         total_count = self.db.table(table).count
         query = Db.normalize_fts_query(query) if query else None
         match = '{' + ' '.join(columns) + '}: ' + f'{query}' if query else None
 
-        c = self.db.conn.execute(f"SELECT COUNT(*) AS filtered_count FROM {table} WHERE rowid IN (SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH ?)", (match,)) if match else None
-        filtered_count = c.fetchone()['filtered_count'] if match else total_count
-        c = self.db.conn.execute(f"SELECT {','.join(columns)} FROM {table} WHERE rowid IN (SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH ?) ORDER BY {order} {direction}{limit_sql}{offset_sql}", (match,)) if match else self.db.conn.execute(f"SELECT {','.join(columns)} FROM {table} ORDER BY {order} {direction}{limit_sql}{offset_sql}")
-        return total_count, filtered_count, [dict(row) for row in c.fetchall()]
+        if match:
+            # COUNT(*) OVER () rides along on each row so the FTS MATCH only runs once.
+            c = self.db.conn.execute(f"SELECT {','.join(columns)}, COUNT(*) OVER () AS filtered_count FROM {table} WHERE rowid IN (SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH ?) ORDER BY {order} {direction}{limit_sql}{offset_sql}", [match] + page_params)
+            rows = [dict(row) for row in c.fetchall()]
+            filtered_count = rows[0]['filtered_count'] if rows else 0
+            for row in rows:
+                del row['filtered_count']
+        else:
+            c = self.db.conn.execute(f"SELECT {','.join(columns)} FROM {table} ORDER BY {order} {direction}{limit_sql}{offset_sql}", page_params)
+            rows = [dict(row) for row in c.fetchall()]
+            filtered_count = total_count
+        return total_count, filtered_count, rows
 
 
 class BaseInterface(Interface):
@@ -487,14 +607,34 @@ class Watchtower:
         except Exception as e:
             exit(e)
 
-        Helpers.create_directories([
-            self.config.get('default', 'cache_dir'),
-            self.config.get('default', 'database_dir'),
-            self.config.get('default', 'module_dir'),
-            self.config.get('default', 'web_dir')
-        ])
+        # Snapshot the interpolated 'default' values once; ConfigParser re-runs
+        # interpolation, case-folding, and dict lookups on every get().
+        self.app_log = self.config.get('default', 'app_log')
+        self.cache_dir = self.config.get('default', 'cache_dir')
+        self.cache_ext = self.config.get('default', 'cache_ext')
+        self.database_dir = self.config.get('default', 'database_dir')
+        self.database_ext = self.config.get('default', 'database_ext')
+        self.module_dir = self.config.get('default', 'module_dir')
+        self.module_ext = self.config.get('default', 'module_ext')
+        self.web_dir = self.config.get('default', 'web_dir')
+        self.web_log = self.config.get('default', 'web_log')
+        self.web_script = self.config.get('default', 'web_script')
+
+        Helpers.create_directories([self.cache_dir, self.database_dir, self.module_dir, self.web_dir])
         self.lock_timeout = 60
 
+        # Dispatch table built once; execute_command used to rebuild this dict per call.
+        self._commands = {
+            'status': self._status,
+            'db create': self._db_create,
+            'db optimize': self._db_optimize,
+            'run': self._run,
+            'import': self._cache_import,
+            'cache clear': self._cache_clear,
+            'web start': self._web_start,
+            'web stop': self._web_stop
+        }
+
     @staticmethod
     def get_config_filepath():
         """
@@ -513,25 +653,23 @@ class Watchtower:
         :return: None.
         """
         assert data, "Response data is empty."
-        assert type(data) is dict, "Response data is not a dict."
-        assert data.get('tables'), "data.get('tables') does not exist."
-        assert type(data.get('tables')) is dict, "data.get('tables') is not a dict."
+        assert isinstance(data, dict), "Response data is not a dict."
+        tables = data.get('tables')
+        assert tables, "data.get('tables') does not exist."
+        assert isinstance(tables, dict), "data.get('tables') is not a dict."
 
-        for table in data.get('tables'):
+        for table, table_data in tables.items():
             assert table != 'imports', f"data.get('tables').get('imports') is not allowed."
-            assert not re.match(Regex.FTS_TABLE,
-                                table), f"data.get('tables').get('{table}') is not allowed because it conflicts with FTS tables."
-            if data.get('tables').get(table).get('pk'): assert type(data.get('tables').get(table).get(
-                'pk')) is str, f"data.get('tables').get('{table}').get('pk') is not a string."
-            assert type(data.get('tables').get(table)) is dict, f"data.get('tables').get('{table}') is not a dict."
-            assert data.get('tables').get(table).get(
-                'rows'), f"data.get('tables').get('{table}').get('rows') is empty or does not exist."
-            assert type(data.get('tables').get(table).get(
-                'rows')) is list, f"data.get('tables').get('{table}').get('rows') is not a list."
-
-            for row in data.get('tables').get(table).get('rows'):
-                assert type(
-                    row) is dict, f"data.get('tables').get('{table}').get('rows') contains an item that is not a dict: {row}"
+            assert not table.endswith(Db.FTS_SUFFIXES), f"data.get('tables').get('{table}') is not allowed because it conflicts with FTS tables."
+            assert isinstance(table_data, dict), f"data.get('tables').get('{table}') is not a dict."
+            pk = table_data.get('pk')
+            if pk: assert isinstance(pk, str), f"data.get('tables').get('{table}').get('pk') is not a string."
+            rows = table_data.get('rows')
+            assert rows, f"data.get('tables').get('{table}').get('rows') is empty or does not exist."
+            assert isinstance(rows, list), f"data.get('tables').get('{table}').get('rows') is not a list."
+
+            for row in rows:
+                assert isinstance(row, dict), f"data.get('tables').get('{table}').get('rows') contains an item that is not a dict: {row}"
 
     def get_all_database_files(self):
         """
@@ -539,7 +677,7 @@ class Watchtower:
 
         :return: List of database file strings.
         """
-        return list(map(lambda d: f"{self.config.get('default', 'database_dir')}{os.sep}{d}", Helpers.list_visible_files(self.config.get('default', 'database_dir'))))
+        return list(map(lambda d: f"{self.database_dir}{os.sep}{d}", Helpers.list_visible_files(self.database_dir)))
 
     def get_most_recent_database(self):
         """
@@ -547,7 +685,11 @@ class Watchtower:
 
         :return: A database file string.
         """
-        return Helpers.sort_files_by_ostime(self.get_all_database_files())[-1]
+        database_dir = self.database_dir
+        with os.scandir(database_dir) as entries:
+            # DirEntry.stat() is cached by scandir, so this is one stat per file instead of two.
+            newest = max((e for e in entries if not e.name.startswith('.')), key=lambda e: e.stat().st_mtime)
+        return f"{database_dir}{os.sep}{newest.name}"
 
     def get_database_directory(self):
         """
@@ -555,7 +697,7 @@ class Watchtower:
 
         :return: Directory path string.
         """
-        return f"{self.config.get('default', 'database_dir')}{os.sep}"
+        return f"{self.database_dir}{os.sep}"
 
     def get_database_filepath(self, filename):
         """
@@ -563,7 +705,7 @@ class Watchtower:
 
         :return: Database file string.
         """
-        return f"{self.config.get('default', 'database_dir')}{os.sep}{Helpers.strip_filename(filename)}{os.extsep}{self.config.get('default', 'database_ext')}"
+        return f"{self.database_dir}{os.sep}{Helpers.strip_filename(filename)}{os.extsep}{self.database_ext}"
 
     def _initialize_config_file(self, config_file):
         """
@@ -596,7 +738,7 @@ class Watchtower:
             except TypeError:
                 exit(f'{Tags.FAIL} Args passed to execute_command() must either be an argparse.Namespace object or a dict.')
         if args.name:
-            if not re.match(Regex.ARG_NAME, args.name):
+            if not Regex.ARG_NAME.match(args.name):
                 exit(f'{Tags.FAIL} Names specified with -n can only use lowercase letters, numbers, and underscores.')
         if args.database:
             args.database = self.get_database_filepath(args.database)
@@ -610,29 +752,40 @@ class Watchtower:
             args.modules = Helpers.remove_duplicates(args.modules)
         if args.files:
             for index, file in enumerate(args.files):
-                args.files[index] = f"{self.config.get('default', 'cache_dir')}{os.sep}{os.path.basename(file)}"
+                args.files[index] = f"{self.cache_dir}{os.sep}{os.path.basename(file)}"
                 if not os.path.exists(args.files[index]):
                     exit(f'{Tags.FAIL} Cache file {Colors.INFO}{args.files[index]}{Colors.RESET} was not found.')
             args.files = Helpers.remove_duplicates(args.files)
         return args
 
-    def _write_file(self, filepath, data, as_bytes=False):
+    @staticmethod
+    def _write_file(filepath, data, as_bytes=False):
         """
-        Writes a target file with data.  Uses a file lock to prevent concurrent changes.
+        Writes a target file with data.  Writes to a temporary file beside the target and atomically
+        renames it into place, so readers never see a torn file and no lock is needed.
 
         :param filepath: File path string.
         :param data: Data to write.
         :param as_bytes: If true, will open the file in binary mode.
         :return: None.
         """
-        file_lock = self._get_file_lock(filepath)
+        temp_fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(filepath) or '.', prefix=f'.{os.path.basename(filepath)}{os.extsep}')
         try:
-            with file_lock.acquire(timeout=self.lock_timeout), (open(filepath, 'wb') if as_bytes else open(filepath, 'w')) as f:
-                f.write(data)
-        except Timeout:
-            Helpers.print_and_log(f'{Tags.FAIL} Could not acquire write lock on {Colors.INFO}{filepath}{Colors.RESET} after {self.lock_timeout} seconds because another instance of this application is using it.  Try again later.')
+            if as_bytes and len(data) > 1048576:
+                # Multi-megabyte payloads go straight to the descriptor; the BufferedWriter
+                # layer would only add a memcpy per chunk on bytes that are already contiguous.
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(temp_fd, view):]
+                finally:
+                    os.close(temp_fd)
+            else:
+                with os.fdopen(temp_fd, 'wb' if as_bytes else 'w') as f:
+                    f.write(data)
+            os.replace(temp_path, filepath)
         finally:
-            self._release_file_lock(file_lock)
+            if os.path.exists(temp_path): os.remove(temp_path)
 
     def _get_all_modules(self):
         """
@@ -649,9 +802,10 @@ class Watchtower:
         :param module: If specified, only the mapping for this module will be returned.
         :return: Dict of all module names mapped to their module file.
         """
-        return dict(map(lambda m: (m, f"{self.config.get('default', 'module_dir')}{os.sep}{m}{os.extsep}{self.config.get('default', 'module_ext')}"), [module] if module else self._get_all_modules()))
+        return dict(map(lambda m: (m, f"{self.module_dir}{os.sep}{m}{os.extsep}{self.module_ext}"), [module] if module else self._get_all_modules()))
 
-    def _get_all_module_classes(self, module):
+    @staticmethod
+    def _get_all_module_classes(module):
         """
         Inspects a Python module for classes which subclass WatchtowerModule and properly implement WatchtowerModuleInterface.
 
@@ -665,9 +819,12 @@ class Watchtower:
         Retrieves all cache files from the cache directory.
 
         :param match: Specifying match will only return files that begin with this string.
-        :return: List of cache file strings.
+        :return: Generator of cache file strings.
         """
-        return list(map(lambda f: f"{self.config.get('default', 'cache_dir')}{os.sep}{f}", [file for file in Helpers.list_visible_files(self.config.get('default', 'cache_dir')) if os.path.basename(file).startswith(match)]))
+        cache_dir = self.cache_dir
+        for file in Helpers.list_visible_files(cache_dir):
+            if file.startswith(match):
+                yield f"{cache_dir}{os.sep}{file}"
 
     def _generate_file_lockname(self, filepath):
         """
@@ -700,21 +857,36 @@ class Watchtower:
         #   https://stackoverflow.com/questions/17708885/flock-removing-locked-file-without-race-condition
         if os.path.exists(lock._lock_file): os.remove(lock._lock_file)
 
+    def _get_webserver_pidfile(self):
+        """
+        Generates the filepath of the web server's pidfile.
+
+        :return: Pidfile path string.
+        """
+        return f"{self.web_dir}{os.sep}web{os.extsep}pid"
+
     def _find_webserver_pid(self):
         """
-        Enumerates running processes and attempts to detect the web server's pid, if any.
+        Finds the web server's pid, if any, by reading the pidfile written by `watchtower web start`.
 
         :return: Pid integer, or None.
         """
-        for process in psutil.process_iter():
-            try:
-                for line in process.cmdline():
-                    if 'flask' in line and f"{self.config.get('default', 'web_script')}" == process.environ().get('FLASK_APP', None):
-                        return process.pid
-            except psutil.AccessDenied:
-                continue
-
-        return None
+        try:
+            with open(self._get_webserver_pidfile()) as f:
+                pid = int(f.read().strip())
+            if os.name == 'nt':
+                # os.kill on Windows calls TerminateProcess for anything other than the
+                # console-control events, so probe the pid with OpenProcess instead.
+                import ctypes
+                handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+                if not handle:
+                    return None
+                ctypes.windll.kernel32.CloseHandle(handle)
+            else:
+                os.kill(pid, 0)  # Signal 0 is a liveness probe; it delivers nothing.
+            return pid
+        except (OSError, ValueError):
+            return None
 
     def _import_file(self, db_conn, filepath, force=False):
         """
@@ -726,32 +898,36 @@ class Watchtower:
         :return: None.
         """
         try:
-            with open(filepath, 'r') as f, open(filepath, 'rb') as fb:
-                data = json.load(f, object_hook=Helpers.json_deserializer)
-                sha1 = hashlib.sha1(fb.read()).hexdigest()
-                Watchtower.validate_module_response(data)
-
-                database = Database(db_conn)
-
-                imports_table_name = 'imports'
-                imports_table = database.table(imports_table_name)
-                import_row = {'module': Helpers.get_module_name_from_file(filepath), 'file': filepath, 'sha1': sha1, 'timestamp': Helpers.generate_utc_datetime()}
-                if not imports_table.exists():
-                    imports_table.create(suggest_column_types([import_row]), pk='id')
-                    [imports_table.create_index([k]) for k in import_row.keys()]
-                    imports_table.enable_fts([name for name in imports_table.columns_dict.keys()], create_triggers=True)
-                    Helpers.print_and_log(f"{Tags.SUCCESS} Created table: {Colors.INFO}{imports_table_name}{Colors.RESET}")
-
-                if len(list(imports_table.rows_where('sha1 = ?', [sha1]))) and not force:
-                    Helpers.print_and_log(f"{Tags.WARN} File {Colors.INFO}{os.path.basename(filepath)}{Colors.RESET} has already been imported and will be skipped.  Run this command again with {Colors.INFO}--force{Colors.RESET} if you want to import it anyway.")
-                    return
-
-                imports_table.insert(import_row, alter=True)
-                import_id = imports_table.last_pk
+            with open(filepath, 'rb', buffering=262144) as fb:
+                raw = fb.read()
+            sha1 = hashlib.sha1(raw).hexdigest()
+            data = Helpers.json_deserialize_bytes(raw)
+            del raw
+            Watchtower.validate_module_response(data)
+
+            database = Database(db_conn)
+
+            imports_table_name = 'imports'
+            imports_table = database.table(imports_table_name)
+            import_row = {'module': Helpers.get_module_name_from_file(filepath), 'file': filepath, 'sha1': sha1, 'timestamp': Helpers.generate_utc_datetime()}
+            if not imports_table.exists():
+                imports_table.create(suggest_column_types([import_row]), pk='id')
+                [imports_table.create_index([k]) for k in import_row.keys()]
+                imports_table.enable_fts([name for name in imports_table.columns_dict.keys()], create_triggers=True)
+                Helpers.print_and_log(f"{Tags.SUCCESS} Created table: {Colors.INFO}{imports_table_name}{Colors.RESET}")
+
+            if not force and database.conn.execute(f"SELECT 1 FROM {imports_table_name} WHERE sha1 = ? LIMIT 1", (sha1,)).fetchone():
+                Helpers.print_and_log(f"{Tags.WARN} File {Colors.INFO}{os.path.basename(filepath)}{Colors.RESET} has already been imported and will be skipped.  Run this command again with {Colors.INFO}--force{Colors.RESET} if you want to import it anyway.")
+                return
+
+            imports_table.insert(import_row, alter=True)
+            import_id = imports_table.last_pk
 
+            try:
                 for table_name in data.get('tables'):
                     rows = data.get('tables').get(table_name).get('rows')
-                    [r.update({'import_id': import_id}) for r in rows]
+                    for r in rows:
+                        r['import_id'] = import_id
                     table = database.table(table_name)
                     pk = data.get('tables').get(table_name).get('pk')
                     if not table.exists():
@@ -760,10 +936,34 @@ class Watchtower:
                         table.enable_fts([name for name in table.columns_dict.keys()], create_triggers=True)
                         Helpers.print_and_log(f"{Tags.SUCCESS} Created table: {Colors.INFO}{table_name}{Colors.RESET}")
                     Helpers.print_and_log(f"{Tags.INFO} Updating table {Colors.INFO}{table_name}{Colors.RESET}...")
-                    table.insert_all(rows, pk=pk, alter=True, replace=True)
+                    # Fast path: when every row matches the existing schema and holds only directly-bindable
+                    # values, one executemany skips sqlite-utils' per-batch reflection and ALTER handling.
+                    bindable = (str, int, float, bytes, bool, type(None))
+                    first_keys = rows[0].keys()
+                    if (set(table.columns_dict) == set(first_keys)
+                            and all(r.keys() == first_keys for r in rows)
+                            and all(isinstance(v, bindable) for r in rows for v in r.values())):
+                        insert_columns = list(first_keys)
+                        database.conn.executemany(
+                            f"INSERT OR REPLACE INTO [{table_name}] ({','.join(f'[{c}]' for c in insert_columns)}) VALUES ({','.join('?' * len(insert_columns))})",
+                            [tuple(r[c] for c in insert_columns) for r in rows])
+                    else:
+                        table.insert_all(rows, pk=pk, alter=True, replace=True)
                     # Ensure newly created rows get indexed
-                    [table.create_index([k]) for k in (set([c.name for c in table.columns]) - (set([i.columns[0] for i in table.indexes])))]
+                    indexed_columns = {i.columns[0] for i in table.indexes}
+                    for c in table.columns:
+                        if c.name not in indexed_columns:
+                            table.create_index([c.name])
                     Helpers.print_and_log(f"{Tags.SUCCESS} Inserted {Colors.INFO}{len(rows):n}{Colors.RESET} row(s) into table {Colors.INFO}{table_name}{Colors.RESET} (import_id = {Colors.INFO}{import_id}{Colors.RESET}).")
+            except BaseException:
+                # sqlite-utils commits as it goes, so an error escaping mid-file would
+                # otherwise leave a durable imports row whose sha1 makes every re-import
+                # skip a file whose tables never landed.  Discard the uncommitted tail,
+                # then drop the row and make the drop stick before the error propagates.
+                database.conn.rollback()
+                database.conn.execute(f"DELETE FROM {imports_table_name} WHERE id = ?", (import_id,))
+                database.conn.commit()
+                raise
         except (json.JSONDecodeError, AssertionError) as e:
             Helpers.print_and_log(f"{Tags.FAIL} Cache file read failed.  File {Colors.INFO}{filepath}{Colors.RESET} contains data that does not adhere to the Module Response guidelines (see {Colors.INFO}README.md{Colors.RESET}).  As a result, this file will not be imported into the database.\n\nReason: {e}\n")
         except IntegrityError as ie:
@@ -784,17 +984,28 @@ class Watchtower:
         db_table = []
         if args.database:
             db_filepath = args.database
-            db_updated = Helpers.timestamp_to_human_datetime(os.path.getmtime(os.path.realpath(db_filepath)))
+            # Resolve the path once; realpath lstat()s every component each time it runs.
+            real_db = os.path.realpath(db_filepath)
+            db_updated = Helpers.timestamp_to_human_datetime(os.path.getmtime(real_db))
             db_table.append(['last_updated:', f'{Colors.INFO}{db_updated}{Colors.RESET}'])
             db = Database(connect(db_filepath))
 
-            for table in db.table_names():
-                if not re.match(Regex.FTS_TABLE, table):
-                    rowcount = db[table].count
+            tables = [table for table in db.table_names() if not table.endswith(Db.FTS_SUFFIXES)]
+            if tables:
+                # One compound statement instead of a COUNT(*) round-trip per table.
+                # Only COUNT(*) columns appear in the SQL; the names are zipped back on
+                # from the Python list, so no table name ever lands in a string literal.
+                # Double-quoted identifiers handle any legal name (brackets cannot).
+                selects = []
+                for table in tables:
+                    ident = table.replace('"', '""')
+                    selects.append(f'SELECT COUNT(*) FROM "{ident}"')
+                counts = db.conn.execute(' UNION ALL '.join(selects)).fetchall()
+                for table, (rowcount,) in zip(tables, counts):
                     db_table.append([f'{table}:', f'{Colors.INFO}{rowcount:n}{Colors.RESET}'])
 
-            Helpers.print_and_log(f'{Tags.INFO} {Colors.INFO}{os.path.basename(os.path.realpath(db_filepath))}{Colors.RESET}')
-            exit(tabulate(db_table, tablefmt='plain'))
+            Helpers.print_and_log(f'{Tags.INFO} {Colors.INFO}{os.path.basename(real_db)}{Colors.RESET}')
+            exit(Helpers.plain_table(db_table))
 
         config_table = []
         web_table = []
@@ -805,11 +1016,11 @@ class Watchtower:
             config_table.append([f'{Colors.INFO}*{Colors.RESET} {module}:', f"{Colors.INFO}{self.config.get(module, 'description', fallback='')}{Colors.RESET}"])
 
         Helpers.print_and_log(f"{Tags.INFO} {Colors.INFO}{os.path.basename(self.config_file)}{Colors.RESET}")
-        Helpers.print_and_log(tabulate(config_table, tablefmt='plain'))
+        Helpers.print_and_log(Helpers.plain_table(config_table))
 
-        Helpers.print_and_log(f"\n{Tags.INFO} {Colors.INFO}{os.path.basename(self.config.get('default', 'web_script'))}{Colors.RESET}")
+        Helpers.print_and_log(f"\n{Tags.INFO} {Colors.INFO}{os.path.basename(self.web_script)}{Colors.RESET}")
 
-        log_file = f"{self.config.get('default', 'web_log')}"
+        log_file = self.web_log
         web_pid = self._find_webserver_pid()
         web_table.append(['status:', f'{Colors.SUCCESS}active{Colors.RESET}' if web_pid else f'{Colors.FAIL}inactive{Colors.RESET}'])
 
@@ -818,7 +1029,7 @@ class Watchtower:
             web_table.append(['log:', f'{Colors.INFO}{log_file}{Colors.RESET}'])
             web_table.append(['pid:', f'{Colors.INFO}{web_pid}{Colors.RESET}'])
 
-        Helpers.print_and_log(tabulate(web_table, tablefmt='plain'))
+        Helpers.print_and_log(Helpers.plain_table(web_table))
 
     def _db_create(self, args):
         """
@@ -834,7 +1045,7 @@ class Watchtower:
         :return: None.
         """
         db_name = args.name if args.name else 'watchtower'
-        db = f"{self.config.get('default', 'database_dir')}{os.sep}{db_name}{os.extsep}{self.config.get('default', 'database_ext')}"
+        db = f"{self.database_dir}{os.sep}{db_name}{os.extsep}{self.database_ext}"
         if os.path.exists(db):
             if args.force:
                 os.remove(db)
@@ -861,17 +1072,20 @@ class Watchtower:
         target_db = args.database
         db = Database(connect(target_db))
         db_lock = self._get_file_lock(target_db)
-        before_size = os.stat(os.path.realpath(target_db)).st_size
+        real_db = os.path.realpath(target_db)
+        before_size = os.stat(real_db).st_size
 
         try:
             with db_lock.acquire(timeout=self.lock_timeout):
-                Helpers.print_and_log(f"{Tags.INFO} Optimizing {Colors.INFO}{os.path.basename(os.path.realpath(target_db))}{Colors.RESET}...")
-                for table in db.tables:
-                    if table.detect_fts() and re.match(Regex.FTS_TABLE, table.name):
-                        table.optimize()
+                Helpers.print_and_log(f"{Tags.INFO} Optimizing {Colors.INFO}{os.path.basename(real_db)}{Colors.RESET}...")
+                # One catalog query finds every FTS index; the old loop ran a detect_fts()
+                # query for every table in the database (FTS shadow tables included).
+                fts_tables = [row[0] for row in db.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND sql LIKE '%USING FTS%'").fetchall()]
+                for name in fts_tables:
+                    db.conn.execute(f'INSERT INTO [{name}] ([{name}]) VALUES (?)', ('optimize',))
                 db.conn.commit()  # Have to do this before vacuuming or we'll get an exception
                 db.vacuum()
-                after_size = os.stat(os.path.realpath(target_db)).st_size
+                after_size = os.stat(real_db).st_size
                 Helpers.print_and_log(f"{Tags.INFO} Reduced size by {Colors.INFO}{before_size-after_size:n}{Colors.RESET} byte(s).")
         except Timeout:
             Helpers.print_and_log(
@@ -879,11 +1093,65 @@ class Watchtower:
         finally:
             self._release_file_lock(db_lock)
 
+    @staticmethod
+    def _run_module_worker(module, module_args, config):
+        """
+        Imports and executes a single module.  Runs inside a worker process, so output is
+        collected and returned for the parent to print rather than printed directly.
+
+        :param module: Module name to run.
+        :param module_args: List of arguments to pass to the module's run() method.
+        :param config: Dict of configuration values (module_dir, module_ext, cache_dir, cache_ext).
+        :return: Tuple of (list of message strings, list of formatted traceback strings).
+        """
+        messages = []
+        tracebacks = []
+        module_dir = os.path.realpath(config['module_dir'])
+        if module_dir not in sys.path:
+            sys.path.append(module_dir)
+
+        args_info = f' with args {Colors.INFO}{module_args}{Colors.RESET}' if module_args and len(module_args) else ''
+        messages.append(f"{Tags.INFO} Running module {Colors.INFO}{module}{Colors.RESET}{args_info}...")
+        try:
+            m = import_module(module)
+            for name, klass in Watchtower._get_all_module_classes(m):
+                try:
+                    output = klass().run(module_args)
+                except Exception as e:
+                    messages.append(f"{Tags.FAIL} An exception was thrown while trying to execute the {Colors.INFO}run(){Colors.RESET} method of class {Colors.INFO}{name}{Colors.RESET} in {Colors.INFO}{module}{os.extsep}{config['module_ext']}{Colors.RESET}.  See details below:\n")
+                    tracebacks.append(''.join(traceback.format_exception(type(e), e, e.__traceback__)))
+                    continue
+                try:
+                    Watchtower.validate_module_response(output)
+                    filepath = Helpers.generate_timestamp_filename(config['cache_dir'], module, config['cache_ext'])
+                    Watchtower._write_file(filepath, Helpers.json_serialize_bytes(output), as_bytes=True)
+                    messages.append(f"{Tags.SUCCESS} Saved cache file: {Colors.INFO}{os.path.basename(filepath)}{Colors.RESET}")
+                    messages.append(f"{Tags.INFO} Execution complete.")
+                except (AssertionError, TypeError) as e:
+                    if output:
+                        temp_fd, temp_path = tempfile.mkstemp()
+                        Watchtower._write_file(temp_path, str(output))
+                        messages.append(f"{Tags.FAIL} Cache file write failed.  The {Colors.INFO}run(){Colors.RESET} method of class {Colors.INFO}{name}{Colors.RESET} in {Colors.INFO}{module}{os.extsep}{config['module_ext']}{Colors.RESET} returned data that does not adhere to the Module Response guidelines (see {Colors.INFO}README.md{Colors.RESET}).  As a result, no cache files have been saved and nothing will be imported into the database.\n\nReason: {e}\n\nYou can inspect the response data here: {Colors.INFO}{temp_path}{Colors.RESET}\n")
+                    else:
+                        messages.append(f"{Tags.WARN} The {Colors.INFO}run(){Colors.RESET} method of class {Colors.INFO}{name}{Colors.RESET} in {Colors.INFO}{module}{os.extsep}{config['module_ext']}{Colors.RESET} did not return any data.  As a result, no cache files have been saved and nothing will be imported into the database.")
+        except ModuleNotFoundError as mnfe:
+            module_filepath = f"{config['module_dir']}{os.sep}{module}{os.extsep}{config['module_ext']}"
+            if not os.path.exists(module_filepath):
+                messages.append(f"{Tags.FAIL} File {Colors.INFO}{module_filepath}{Colors.RESET} for module {Colors.INFO}{module}{Colors.RESET} does not exist.  Try adding it and then run this command again.")
+            else:
+                messages.append(f"{Tags.FAIL} An error occurred while trying to run {Colors.INFO}{module_filepath}{Colors.RESET} for module {Colors.INFO}{module}{Colors.RESET}.  See details below:\n\n{mnfe}\n")
+        except InvalidImplementation as ii:
+            lines = str(ii).split('\n')
+            klass = lines[1].split(' ')[1]
+            issues = '\n'.join(map(str, lines[2:]))
+            messages.append(f"{Tags.FAIL} Execution failed because {Colors.INFO}{klass}{Colors.RESET} in {Colors.INFO}{config['module_dir']}{os.sep}{module}{os.extsep}{config['module_ext']}{Colors.RESET} does not properly implement the Module interface.\n{issues}\n")
+        return messages, tracebacks
+
     def _run(self, args):
         """
         Handler for the `watchtower run` command.
 
-        Executes the run method for all modules.
+        Executes the run method for all modules, fanning the modules out across a process pool.
 
         Optional arguments:
             -m: Specify a particular module.
@@ -892,55 +1160,41 @@ class Watchtower:
         :param args: Namespace object of arguments.
         :return: None.
         """
-        sys.path.append(os.path.realpath(self.config.get('default', 'module_dir')))
         modules = args.modules if args.modules else [m for m in self._get_all_modules()]
+        worker_config = {
+            'module_dir': self.module_dir,
+            'module_ext': self.module_ext,
+            'cache_dir': self.cache_dir,
+            'cache_ext': self.cache_ext,
+        }
 
+        runnable = []
         for module in modules:
-            if not re.match(Regex.ARG_NAME, module):
+            if not Regex.ARG_NAME.match(module):
                 Helpers.print_and_log(f'{Tags.FAIL} Could not run module {Colors.INFO}{module}{Colors.RESET}: Module names can only use lowercase letters, numbers, and underscores.')
                 continue
             if module == 'test':
                 # FIXME (jbacco): Known issue where modules named "test" won't run.
                 Helpers.print_and_log(f'{Tags.FAIL} Could not run module {Colors.INFO}test{Colors.RESET}: An issue exists which prevents modules named {Colors.INFO}test{Colors.RESET} from running correctly.  Try renaming it.')
                 continue
-            try:
-                args_info = f' with args {Colors.INFO}{args.args}{Colors.RESET}' if args.args and len(args.args) else ''
-                Helpers.print_and_log(f"{Tags.INFO} Running module {Colors.INFO}{module}{Colors.RESET}{args_info}...")
-                m = import_module(module)
-                for name, klass in self._get_all_module_classes(m):
-                    try:
-                        output = klass().run(args.args)
-                    except Exception as e:
-                        Helpers.print_and_log(f"{Tags.FAIL} An exception was thrown while trying to execute the {Colors.INFO}run(){Colors.RESET} method of class {Colors.INFO}{name}{Colors.RESET} in {Colors.INFO}{module}{os.extsep}{self.config.get('default', 'module_ext')}{Colors.RESET}.  See details below:\n")
-                        log_file = f"{self.config.get('default', 'app_log')}"
-                        with open(log_file, 'a') as app_log:
-                            traceback.print_exception(type(e), e, e.__traceback__)
-                            traceback.print_exception(type(e), e, e.__traceback__, file=app_log)
-                        continue
-                    try:
-                        Watchtower.validate_module_response(output)
-                        filepath = Helpers.generate_timestamp_filename(self.config.get('default', 'cache_dir'), module, self.config.get('default', 'cache_ext'))
-                        self._write_file(filepath, json.dumps(output, default=Helpers.json_serializer))
-                        Helpers.print_and_log(f"{Tags.SUCCESS} Saved cache file: {Colors.INFO}{os.path.basename(filepath)}{Colors.RESET}")
-                        Helpers.print_and_log(f"{Tags.INFO} Execution complete.")
-                    except (AssertionError, TypeError) as e:
-                        if output:
-                            temp_fd, temp_path = tempfile.mkstemp()
-                            self._write_file(temp_path, str(output))
-                            Helpers.print_and_log(f"{Tags.FAIL} Cache file write failed.  The {Colors.INFO}run(){Colors.RESET} method of class {Colors.INFO}{name}{Colors.RESET} in {Colors.INFO}{module}{os.extsep}{self.config.get('default', 'module_ext')}{Colors.RESET} returned data that does not adhere to the Module Response guidelines (see {Colors.INFO}README.md{Colors.RESET}).  As a result, no cache files have been saved and nothing will be imported into the database.\n\nReason: {e}\n\nYou can inspect the response data here: {Colors.INFO}{temp_path}{Colors.RESET}\n")
-                        else:
-                            Helpers.print_and_log(f"{Tags.WARN} The {Colors.INFO}run(){Colors.RESET} method of class {Colors.INFO}{name}{Colors.RESET} in {Colors.INFO}{module}{os.extsep}{self.config.get('default', 'module_ext')}{Colors.RESET} did not return any data.  As a result, no cache files have been saved and nothing will be imported into the database.")
-            except ModuleNotFoundError as mnfe:
-                module_filepath = f"{self.config.get('default', 'module_dir')}{os.sep}{module}{os.extsep}{self.config.get('default', 'module_ext')}"
-                if not os.path.exists(module_filepath):
-                    Helpers.print_and_log(f"{Tags.FAIL} File {Colors.INFO}{module_filepath}{Colors.RESET} for module {Colors.INFO}{module}{Colors.RESET} does not exist.  Try adding it and then run this command again.")
-                else:
-                    Helpers.print_and_log(f"{Tags.FAIL} An error occurred while trying to run {Colors.INFO}{module_filepath}{Colors.RESET} for module {Colors.INFO}{module}{Colors.RESET}.  See details below:\n\n{mnfe}\n")
-            except InvalidImplementation as ii:
-                lines = str(ii).split('\n')
-                klass = lines[1].split(' ')[1]
-                issues = '\n'.join(map(str, lines[2:]))
-                Helpers.print_and_log(f"{Tags.FAIL} Execution failed because {Colors.INFO}{klass}{Colors.RESET} in {Colors.INFO}{self.config.get('default', 'module_dir')}{os.sep}{module}{os.extsep}{self.config.get('default', 'module_ext')}{Colors.RESET} does not properly implement the Module interface.\n{issues}\n")
+            runnable.append(module)
+
+        if not runnable:
+            return
+
+        # Modules are independent (each writes its own cache file), so they fan out across
+        # worker processes.  Workers return their messages instead of printing so each
+        # module's output stays contiguous in the log.
+        with open(self.app_log, 'a', buffering=262144) as app_log:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=min(len(runnable), os.cpu_count() or 1)) as executor:
+                futures = [executor.submit(Watchtower._run_module_worker, module, args.args, worker_config) for module in runnable]
+                for future in concurrent.futures.as_completed(futures):
+                    messages, tracebacks = future.result()
+                    for message in messages:
+                        Helpers.print_and_log(message)
+                    for tb in tracebacks:
+                        print(tb, end='', file=sys.stderr)
+                        app_log.write(tb)
 
     def _cache_import(self, args):
         """
@@ -962,30 +1216,51 @@ class Watchtower:
         if not args.database:
             exit(f'{Tags.FAIL} No database specified.  Run this command again with {Colors.INFO}-d{Colors.RESET} <{Colors.INFO}database{Colors.RESET}>.')
 
-        files = list(map(lambda f: f, args.files if args.files else [file for module in args.modules for file in self._get_all_cache_files(module)] if args.modules else self._get_all_cache_files()))
+        files = args.files if args.files else [file for module in (args.modules or ['']) for file in self._get_all_cache_files(module)]
 
         if not len(files):
             exit(f"{Tags.WARN} No cache files found.")
 
         target_db = args.database
 
-        db_conn = connect(target_db)
-        temp_db_conn = connect('')
-        db_conn.backup(temp_db_conn)  # Copy the file database to a temporary database (much faster writes)
+        # A larger statement cache keeps each table's prepared INSERT alive across cache
+        # files, so repeat imports skip the parse/plan step entirely.
+        db_conn = connect(target_db, cached_statements=512)
+        # Durability is pure overhead during the bulk window -- the recovery story is
+        # "re-run import".  MEMORY rather than OFF so rollback stays defined for the
+        # pre-existing data while the journal fsyncs still disappear.
+        db_conn.execute('PRAGMA journal_mode=MEMORY')
+        db_conn.execute('PRAGMA synchronous=OFF')
+        db_conn.execute('PRAGMA temp_store=MEMORY')
+        db_conn.execute('PRAGMA locking_mode=EXCLUSIVE')
 
         db_lock = self._get_file_lock(target_db)
 
         try:
             with db_lock.acquire(timeout=self.lock_timeout):
+                # Write straight into the file database.  The old backup-to-memory staging
+                # copied the entire database twice per run, which dominated cost (and
+                # doubled memory) once the database grew.  sqlite-utils commits batch by
+                # batch as it inserts; the final commit flushes whatever its last batch
+                # left open.
                 for f in files:
                     Helpers.print_and_log(f"{Tags.INFO} Importing file: {Colors.INFO}{os.path.basename(f)}{Colors.RESET}")
-                    self._import_file(temp_db_conn, f, args.force)
+                    self._import_file(db_conn, f, args.force)
                 Helpers.print_and_log(f"{Tags.INFO} Committing changes...")
-                temp_db_conn.backup(db_conn)  # If we don't get past this, the changes are lost
+                db_conn.commit()
                 Helpers.print_and_log(f"{Tags.INFO} Import complete.")
         except Timeout:
             Helpers.print_and_log(f'{Tags.FAIL} Could not acquire write lock on {Colors.INFO}{target_db}{Colors.RESET} after {Colors.INFO}{self.lock_timeout}{Colors.RESET} seconds because another instance of this application is using it.  Try again later.')
         finally:
+            # Restore SQLite's default durability settings once the bulk window closes.
+            # An escaping error can leave a transaction open, and synchronous cannot be
+            # changed inside one -- discard the transaction first so the restore cannot
+            # mask the original error.
+            db_conn.rollback()
+            db_conn.execute('PRAGMA locking_mode=NORMAL')
+            db_conn.execute('PRAGMA journal_mode=DELETE')
+            db_conn.execute('PRAGMA synchronous=FULL')
+            db_conn.close()
             self._release_file_lock(db_lock)
 
     def _cache_clear(self, args):
@@ -1000,18 +1275,24 @@ class Watchtower:
         :param args: Namespace object of arguments.
         :return: None.
         """
-        files = list(map(lambda f: f, [file for module in args.modules for file in self._get_all_cache_files(module)] if args.modules else self._get_all_cache_files()))
-        cleared = 0
-        for f in files:
+        files = [file for module in (args.modules or ['']) for file in self._get_all_cache_files(module)]
+
+        def clear_file(f):
             file_lock = self._get_file_lock(f)  # If we can't get a file lock, we shouldn't be deleting it
             try:
                 with file_lock.acquire(timeout=self.lock_timeout):
                     os.remove(f)
-                    cleared += 1
+                    return True
             except Timeout:
                 Helpers.print_and_log(f'{Tags.FAIL} File {Colors.INFO}{f}{Colors.RESET} appears to be in use by another instance of this application.  Try again later.')
+                return False
             finally:
                 self._release_file_lock(file_lock)
+
+        # Each deletion is an independent lock-acquire + unlink round-trip, so threads
+        # overlap the waiting instead of serializing it.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(files) or 1)) as executor:
+            cleared = sum(executor.map(clear_file, files))
         Helpers.print_and_log(f"{Tags.INFO} Cleared {Colors.INFO}{cleared}{Colors.RESET} cache file(s).")
 
     def _web_start(self, args):
@@ -1026,20 +1307,42 @@ class Watchtower:
         if self._find_webserver_pid():
             exit(f"{Tags.WARN} Web server appears to be running.  Check {Colors.INFO}http://127.0.0.1:5000/{Colors.RESET} or try stopping it with {Colors.INFO}watchtower web stop{Colors.RESET} and then run this command again.")
 
-        log_file = f"{self.config.get('default', 'web_log')}"
-
-        with open(log_file, 'a') as web_output:
-            env = os.environ.copy()
-            env.update({'FLASK_APP': f"{self.config.get('default', 'web_script')}", 'FLASK_ENV': 'development', 'FLASK_DEBUG': '0'})
-            process = subprocess.Popen(
-                ['python' if os.name == 'nt' else 'python3', '-m', 'flask', 'run'],
-                env=env,
-                stdout=web_output,
-                stderr=web_output,
-                shell=True if os.name == 'nt' else False
-            )
-            Helpers.print_and_log(f"{Tags.SUCCESS} Web server listening on {Colors.INFO}http://127.0.0.1:5000/{Colors.RESET}")
-            Helpers.print_and_log(f"{Tags.INFO} Log: {Colors.INFO}{log_file}{Colors.RESET}")
+        log_file = self.web_log
+        web_script = self.web_script
+
+        if os.name == 'nt':
+            # No fork on Windows, so spawn `flask run` in a separate interpreter there.
+            with open(log_file, 'a', buffering=262144) as web_output:
+                env = os.environ.copy()
+                env.update({'FLASK_APP': web_script, 'FLASK_ENV': 'development', 'FLASK_DEBUG': '0'})
+                process = subprocess.Popen(
+                    ['python', '-m', 'flask', 'run'],
+                    env=env,
+                    stdout=web_output,
+                    stderr=web_output,
+                    shell=True
+                )
+                web_pid = process.pid
+        else:
+            # Fork and run werkzeug in the child instead of spawning a whole new interpreter
+            # just to re-import Flask through `python3 -m flask run`.
+            web_pid = os.fork()
+            if web_pid == 0:
+                try:
+                    os.setsid()  # Detach from the parent's session so the server outlives the CLI.
+                    log_fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                    os.dup2(log_fd, sys.stdout.fileno())
+                    os.dup2(log_fd, sys.stderr.fileno())
+                    os.close(log_fd)
+                    sys.path.insert(0, os.path.dirname(web_script))
+                    web = import_module(Helpers.strip_filename(web_script))
+                    web.app.run(host='127.0.0.1', port=5000, use_reloader=False)
+                finally:
+                    os._exit(0)  # Never fall back into the parent's CLI code.
+
+        self._write_file(self._get_webserver_pidfile(), str(web_pid))
+        Helpers.print_and_log(f"{Tags.SUCCESS} Web server listening on {Colors.INFO}http://127.0.0.1:5000/{Colors.RESET}")
+        Helpers.print_and_log(f"{Tags.INFO} Log: {Colors.INFO}{log_file}{Colors.RESET}")
 
     def _web_stop(self, args):
         """
@@ -1054,6 +1357,10 @@ class Watchtower:
 
         if pid:
             os.kill(pid, signal.SIGINT)
+            try:
+                os.remove(self._get_webserver_pidfile())
+            except OSError:
+                pass
             exit(f"{Tags.SUCCESS} Web server stopped.")
 
         exit(f"{Tags.WARN} Web server does not appear to be running.")
@@ -1068,21 +1375,12 @@ class Watchtower:
         """
         cmd = ' '.join(command) if type(command) is list else command
         args = self._validate_and_normalize_args(args)
-        valid_commands = {
-            'status': self._status,
-            'db create': self._db_create,
-            'db optimize': self._db_optimize,
-            'run': self._run,
-            'import': self._cache_import,
-            'cache clear': self._cache_clear,
-            'web start': self._web_start,
-            'web stop': self._web_stop
-        }
 
-        if cmd in valid_commands:
-            valid_commands.get(cmd)(args)
-        else:
+        try:
+            handler = self._commands[cmd]
+        except KeyError:
             exit(f'{Tags.FAIL} Command not found.  Try {Colors.INFO}watchtower{Colors.RESET} for a list of commands.')
+        handler(args)
 
 
 def _parse_args():
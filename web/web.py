@@ -2,11 +2,22 @@
 
 import sys
 import os
+import gzip
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from configparser import ConfigParser, ExtendedInterpolation, ParsingError, DuplicateSectionError, DuplicateOptionError
-from flask import Flask, abort, render_template, jsonify, request, send_from_directory
+from flask import Flask, abort, g, render_template, jsonify, request, send_file
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))  # Need this for the next import
 from watchtower import Watchtower, Db, Helpers
 
+try:
+    # Optional C-accelerated JSON encoder; Flask's jsonify is the fallback.
+    import orjson
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
 app.config.update({'JSON_SORT_KEYS': False})
 in_development_mode = app.config.get('ENV').lower() == 'development'
@@ -14,32 +25,97 @@ in_development_mode = app.config.get('ENV').lower() == 'development'
 watchtower = Watchtower()
 config_file = f'{os.path.dirname(os.path.realpath(__file__))}{os.sep}web.conf'
 
-if not os.path.exists(config_file):
-    message = f'Configuration file {config_file} does not exist.\n' if in_development_mode else None
-    abort(500, message)
-try:
-    config = ConfigParser(interpolation=ExtendedInterpolation(), default_section='default', allow_no_value=True)
-    config.read(config_file)
-except ParsingError as pe:
-    lines = str(pe).split('\n')
-    errors = '\n'.join(map(str, lines[1:]))
-    message = f'Configuration file {config_file} could not be loaded due to parsing errors:\n\n{errors}\n' if in_development_mode else None
-    abort(500, message)
-except (DuplicateSectionError, DuplicateOptionError) as de:
-    message = f'Configuration file {config_file} could not be loaded due to parsing errors:\n\n{de}\n' if in_development_mode else None
-    abort(500, message)
+
+def ojsonify(obj):
+    """
+    Builds a JSON response with the fastest available encoder.
+
+    :param obj: Object to serialize.
+    :return: JSON Flask response.
+    """
+    if orjson is None:
+        return jsonify(obj)
+    return app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+
+@lru_cache(maxsize=4)
+def load_config(mtime):
+    """
+    Parses web.conf and resolves its sections into plain dicts: column strings become
+    stripped lists and blank values become None (meaning "ask the database").  Keyed by
+    the file's mtime, so the parse and the per-get ExtendedInterpolation work only re-run
+    when the file actually changes — workers forked after the first load share the result.
+
+    :param mtime: Modification time of the configuration file (the cache key).
+    :return: Dict of section name strings mapped to dicts of table names and column lists.
+    """
+    if mtime is None:
+        message = f'Configuration file {config_file} does not exist.\n' if in_development_mode else None
+        abort(500, message)
+    try:
+        parser = ConfigParser(interpolation=ExtendedInterpolation(), default_section='default', allow_no_value=True)
+        parser.read(config_file)
+    except ParsingError as pe:
+        lines = str(pe).split('\n')
+        errors = '\n'.join(map(str, lines[1:]))
+        message = f'Configuration file {config_file} could not be loaded due to parsing errors:\n\n{errors}\n' if in_development_mode else None
+        abort(500, message)
+    except (DuplicateSectionError, DuplicateOptionError) as de:
+        message = f'Configuration file {config_file} could not be loaded due to parsing errors:\n\n{de}\n' if in_development_mode else None
+        abort(500, message)
+
+    return {
+        section: {key: [col.strip() for col in value.split(',')] if value and value.strip() else None
+                  for key, value in parser[section].items()}
+        for section in parser.sections()
+    }
+
+
+def get_resolved_config():
+    """
+    Returns the resolved configuration for the file's current state.
+
+    :return: Dict of section name strings mapped to dicts of table names and column lists.
+    """
+    try:
+        mtime = os.path.getmtime(config_file)
+    except OSError:
+        mtime = None
+    return load_config(mtime)
+
+
+# Encodes large response chunks off the request thread.  Threads rather than processes:
+# orjson releases the GIL while encoding, and shipping the rows to a worker process would
+# cost more in pickling than the encode itself.
+json_pool = ThreadPoolExecutor(max_workers=2)
+
+
+def encode_rows(rows):
+    """
+    Encodes a list of rows as a comma-joined JSON fragment.
+
+    :param rows: List of rows where each row is a dict in the form of {"column_name": value}.
+    :return: JSON fragment bytes.
+    """
+    return b','.join(orjson.dumps(row) for row in rows)
 
 
 class DataTables:
     """
     Class used to handles actions related to a DataTable.
     """
+    _table_config_cache = {}
+
     def __init__(self):
+        # One snapshot of the combined GET/POST values; CombinedMultiDict.get walks both
+        # underlying dicts on every call.
+        values = dict(request.values.items())
+        get = values.get
         self.length = 10
         self.start = 0
-        self.draw = int(request.values.get('draw', 1))
-        self.order_col_index = int(request.values.get('order[0][column]', 0)) + 1
-        self.direction = 'DESC' if request.values.get('order[0][dir]', 'ASC') == 'desc' else 'ASC'
+        self.draw = int(get('draw', 1))
+        self.order_col_index = int(get('order[0][column]', 0)) + 1
+        self.direction = 'DESC' if get('order[0][dir]', 'ASC') == 'desc' else 'ASC'
 
     @staticmethod
     def get_table_config(database, tables=None):
@@ -49,25 +125,49 @@ class DataTables:
         If the configuration file contains key-value pairs for a given database, then these values will be used to
         determine table and column visibility.
 
+        Results are cached per (database, tables) pair and invalidated when the configuration
+        file or the database file changes, so repeat requests skip the config walk and the
+        per-table column queries.
+
         :param database: Database to use.
         :param tables: List of tables to use (if None, then all tables will be retrieved).
-        :return: Dict of table name strings mapped to their comma-separated column name strings
+        :return: Dict of table name strings mapped to lists of column name strings.
         """
         section_key = f"{Helpers.strip_filename(database.db_path)}"
+        cache_key = (database.db_path, section_key, tuple(tables) if tables else None)
+        mtimes = (os.path.getmtime(config_file), os.path.getmtime(database.db_path))
+        cached = DataTables._table_config_cache.get(cache_key)
+        if cached and cached[0] == mtimes:
+            return cached[1]
 
-        if not config.has_section(section_key):
-            return dict(map(lambda t: (t, ','.join(database.get_table_columns(t))), database.get_tables() if not tables else tables))
+        resolved_config = get_resolved_config()
 
-        tableconfig = config[section_key]
+        if section_key not in resolved_config:
+            all_columns = database.get_all_table_columns()
+            normalized_tables = {t: all_columns[t] for t in (tables if tables else all_columns)}
+        else:
+            normalized_tables = {}
+            for table, columns in resolved_config[section_key].items():
+                if not tables or table in tables:
+                    normalized_tables[table] = columns if columns else database.get_table_columns(table)
 
-        normalized_tables = {}
+        DataTables._table_config_cache[cache_key] = (mtimes, normalized_tables)
+        return normalized_tables
 
-        for table, columnstring in tableconfig.items():
-            columnstring = ','.join([col.strip() for col in columnstring.split(',')]) if columnstring.strip() else ','.join(database.get_table_columns(table))
-            if not tables or table in tables:
-                normalized_tables[table] = columnstring
+    @staticmethod
+    def get_table_columns_for(database, table):
+        """
+        Looks up the columns for a single table without compiling the full table config.
+        The search API only ever needs one table's columns, so this is a dict probe into
+        the resolved configuration rather than a walk over the database's whole section.
 
-        return normalized_tables
+        :param database: Database to use.
+        :param table: Table whose columns should be returned.
+        :return: List of column name strings.
+        """
+        section = get_resolved_config().get(f"{Helpers.strip_filename(database.db_path)}")
+        columns = section.get(table) if section else None
+        return columns if columns else database.get_table_columns(table)
 
     def get_response(self, total_count, filtered_count, rows, error=None):
         """
@@ -79,18 +179,142 @@ class DataTables:
         :param error: Error message to display (do not set if there's no error).
         :return: JSON object DataTables response.
         """
-        return jsonify({
-            'draw': self.draw,
-            'recordsTotal': total_count,
-            'recordsFiltered': filtered_count,
-            'data': rows
-        }) if not error else jsonify({
-            'draw': self.draw,
-            'recordsTotal': 0,
-            'recordsFiltered': 0,
-            'data': [],
-            'error': error
-        })
+        if error:
+            return ojsonify({
+                'draw': self.draw,
+                'recordsTotal': 0,
+                'recordsFiltered': 0,
+                'data': [],
+                'error': error
+            })
+
+        if orjson is None or len(rows) <= 500:
+            return ojsonify({
+                'draw': self.draw,
+                'recordsTotal': total_count,
+                'recordsFiltered': filtered_count,
+                'data': rows
+            })
+
+        # Large result sets stream in 64-row chunks so the full JSON document is never
+        # built in memory on top of the row list.  Submitting every chunk to the pool up
+        # front lets later chunks encode while earlier ones are still being sent.
+        head = b'{"draw":%d,"recordsTotal":%d,"recordsFiltered":%d,"data":[' % (self.draw, total_count, filtered_count)
+
+        def generate():
+            yield head
+            futures = [json_pool.submit(encode_rows, rows[start:start + 64]) for start in range(0, len(rows), 64)]
+            for index, future in enumerate(futures):
+                chunk = future.result()
+                yield chunk if index == 0 else b',' + chunk
+            yield b']}'
+
+        return app.response_class(generate(), mimetype='application/json')
+
+
+def get_request_databases():
+    """
+    Retrieves the database file list once per request and caches it on flask.g, so a view
+    that needs the list several times only scans the directory once.
+
+    :return: List of database file strings.
+    """
+    if 'all_dbs' not in g:
+        g.all_dbs = watchtower.get_all_database_files()
+    return g.all_dbs
+
+
+def get_request_newest_database():
+    """
+    Retrieves the most recently modified database file, cached on flask.g per request.
+
+    :return: Database file string, or None if no databases exist.
+    """
+    if 'newest_db' not in g:
+        all_dbs = get_request_databases()
+        # Only the newest file matters, so a max() pass beats sorting the whole list.
+        g.newest_db = max(all_dbs, key=os.path.getmtime) if all_dbs else None
+    return g.newest_db
+
+
+def get_request_database_index():
+    """
+    Builds an index of stripped database names mapped to their filepaths, cached on flask.g,
+    so name lookups are one dict probe instead of a scan over the file list.
+
+    :return: Dict of database name strings mapped to database file strings.
+    """
+    if 'db_index' not in g:
+        g.db_index = {Helpers.strip_filename(path): path for path in get_request_databases()}
+    return g.db_index
+
+
+# Per-thread Db cache: sqlite3 connections cannot cross threads, so each server thread
+# keeps its own, invalidated when the database file changes on disk.
+db_pool = threading.local()
+
+
+def get_db(db_filepath):
+    """
+    Returns a Db object for a filepath, reusing this thread's connection across requests
+    until the database file is replaced by a new import.
+
+    :param db_filepath: Database filepath.
+    :return: Db object.
+    """
+    pool = getattr(db_pool, 'dbs', None)
+    if pool is None:
+        pool = db_pool.dbs = {}
+    mtime = os.path.getmtime(db_filepath)
+    cached = pool.get(db_filepath)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    database = Db(db_filepath)
+    pool[db_filepath] = (mtime, database)
+    return database
+
+
+@app.before_request
+def resolve_request_database():
+    """
+    Resolves the request's database parameter into a filepath and a Db object once, before
+    the view runs.  The search page, the base template and the search API all need the same
+    resolution, so doing it here means one lookup per request instead of up to three.
+
+    Sets g.db_param, g.db_filepath and g.db (the latter two are None when the parameter
+    does not match a database); views decide how to report a failed resolution.
+    """
+    if request.endpoint not in ('global_search_page', 'api'):
+        return
+    g.db_param = Helpers.empty_to_none(request.values.get('database', None))
+    g.db_filepath = get_request_database_index().get(g.db_param) if g.db_param else get_request_newest_database()
+    g.db = get_db(g.db_filepath) if g.db_filepath else None
+
+
+@app.after_request
+def compress_response(response):
+    """
+    Gzips JSON responses when the client accepts it.  DataTables rows repeat the same
+    column keys in every row, so search payloads compress extremely well.
+
+    :param response: Flask response object.
+    :return: Flask response object, gzip-encoded when worthwhile.
+    """
+    if (response.mimetype != 'application/json'
+            or response.status_code != 200
+            or response.is_streamed
+            or response.direct_passthrough
+            or 'gzip' not in request.headers.get('Accept-Encoding', '').lower()):
+        return response
+
+    data = response.get_data()
+    if len(data) < 1024:  # Tiny payloads fit in one packet either way.
+        return response
+
+    response.set_data(gzip.compress(data, compresslevel=4))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
 
 
 @app.route('/')
@@ -100,13 +324,8 @@ def global_search_page():
 
     :return: Rendered Jinja HTML template.
     """
-    db_param = Helpers.empty_to_none(request.values.get('database', None))
-    all_dbs = watchtower.get_all_database_files()
-    db_filepath = watchtower.get_database_filepath(db_param) if db_param else Helpers.sort_files_by_ostime(all_dbs)[-1] if all_dbs else None
-
-    db = Db(db_filepath)
     query = request.values.get('query', None)
-    tables = DataTables.get_table_config(db)
+    tables = DataTables.get_table_config(g.db)
 
     return render_custom_template('global_search.html', global_search_api='/api/v1/global-search/search', query=query, tables=tables)
 
@@ -121,12 +340,8 @@ def api(version, method, action):
     :param action: Action being requested.
     :return: JSON object API response.
     """
-    if version == 'v1' and method == 'global-search' and action == 'search':
-        return global_search()
-    if version == 'v1' and method == 'database' and action == 'download':
-        return database_download()
-
-    return jsonify({'error': 'Invalid request.'})
+    handler = api_routes.get((version, method, action))
+    return handler() if handler else ojsonify({'error': 'Invalid request.'})
 
 
 def render_custom_template(template, **kwargs):
@@ -135,18 +350,14 @@ def render_custom_template(template, **kwargs):
 
     :return: Rendered Jinja HTML template.
     """
-    db_param = Helpers.empty_to_none(request.values.get('database', None))
-    all_dbs = watchtower.get_all_database_files()
-    db_filepath = watchtower.get_database_filepath(db_param) if db_param else Helpers.sort_files_by_ostime(all_dbs)[-1] if all_dbs else None
-
-    if not db_filepath or db_filepath not in all_dbs:
-        if db_param:
-            abort(500, f'Database "{db_param}" not found.')
+    if not g.db_filepath:
+        if g.db_param:
+            abort(500, f'Database "{g.db_param}" not found.')
         else:
             abort(500, f'No databases found.')
 
-    databases = [Helpers.strip_filename(db) for db in watchtower.get_all_database_files()]
-    databases.insert(0, databases.pop(databases.index(Helpers.strip_filename(db_filepath))))  # Put chosen database at front of list
+    chosen = Helpers.strip_filename(g.db_filepath)
+    databases = [chosen] + [name for name in get_request_database_index() if name != chosen]  # Put chosen database at front of list
 
     kwargs.update(database_download_api='/api/v1/database/download')
     kwargs.update(databases=databases)
@@ -154,10 +365,18 @@ def render_custom_template(template, **kwargs):
     return render_template(template, **kwargs)
 
 
+# DataTables re-requests identical pages as users scroll back and forth, so identical
+# search tuples within this window are served from memory without touching SQLite.
+SEARCH_CACHE_TTL = 5
+search_cache = {}
+
+
 def global_search():
     """
     API handler for DataTables JSON responses to global search requests.
 
+    Identical searches within SEARCH_CACHE_TTL seconds are answered from an in-process cache.
+
     Request parameters:
         database: Database to use (required).
         table: Table to search (required).
@@ -170,38 +389,47 @@ def global_search():
     :return: JSON object DataTables response.
     """
     dt = DataTables()
+    values = dict(request.values.items())
 
-    db_param = Helpers.empty_to_none(request.values.get('database', None))
-    all_dbs = watchtower.get_all_database_files()
-    db_filepath = watchtower.get_database_filepath(db_param) if db_param else None
+    def get_int(name, default):
+        value = values.get(name)
+        return int(value) if value else default
 
-    if not db_filepath or db_filepath not in all_dbs:
-        if db_param:
-            return dt.get_response(0, 0, [], f'Database "{db_param}" not found.')
-        else:
-            return dt.get_response(0, 0, [], f'Must specify a database parameter.')
+    # The search API requires an explicit database parameter; the hook's newest-database
+    # fallback only applies to page renders.
+    if not g.db_param:
+        return dt.get_response(0, 0, [], f'Must specify a database parameter.')
+    if not g.db_filepath:
+        return dt.get_response(0, 0, [], f'Database "{g.db_param}" not found.')
 
-    db = Db(db_filepath)
-    table = Helpers.empty_to_none(request.values.get('table', None))
+    db = g.db
+    db_filepath = g.db_filepath
+    table = Helpers.empty_to_none(values.get('table'))
 
     if not table:
         return dt.get_response(0, 0, [], f'No table specified.')
     if not db.table_exists(table):
         return dt.get_response(0, 0, [], f"Table <b>{table}</b> does not exist.")
 
-    columns = DataTables.get_table_config(db, [table])[table].split(',')
-    query = Helpers.empty_to_none(request.values.get('query', None))
-    order = Helpers.empty_to_none(request.values.get('order', None))
-    order = int(order) if order else dt.order_col_index
-    direction = Helpers.empty_to_none(request.values.get('direction', None))
-    direction = int(direction) if direction else dt.direction
-    limit = Helpers.empty_to_none(request.values.get('length', None))
-    limit = int(limit) if limit else dt.length
-    offset = Helpers.empty_to_none(request.values.get('start', None))
-    offset = int(offset) if offset else dt.start
+    columns = DataTables.get_table_columns_for(db, table)
+    query = Helpers.empty_to_none(values.get('query'))
+    order = get_int('order', dt.order_col_index)
+    direction = get_int('direction', dt.direction)
+    limit = get_int('length', dt.length)
+    offset = get_int('start', dt.start)
+
+    cache_key = (db_filepath, table, query, order, direction, limit, offset)
+    cached = search_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < SEARCH_CACHE_TTL:
+        return dt.get_response(*cached[1])
 
     try:
         total_count, filtered_count, rows = db.search_table(table, columns, query, order, direction, limit, offset)
+        if len(search_cache) > 128:
+            now = time.monotonic()
+            for key in [k for k, v in search_cache.items() if now - v[0] >= SEARCH_CACHE_TTL]:
+                del search_cache[key]
+        search_cache[cache_key] = (time.monotonic(), (total_count, filtered_count, rows))
         return dt.get_response(total_count, filtered_count, rows)
     except Exception:
         return dt.get_response(0, 0, [], f"Error attempting to fetch data: Check your web.conf file or your API request for references to tables or columns that don't exist.")
@@ -219,9 +447,20 @@ def database_download():
     db_param = request.values.get('database', None)
 
     if not db_param:
-        return jsonify({'error': 'No database specified.'})
+        return ojsonify({'error': 'No database specified.'})
+
+    db_filepath = get_request_database_index().get(Helpers.strip_filename(db_param))
 
-    if watchtower.get_database_filepath(db_param):
-        return send_from_directory(directory=watchtower.get_database_directory(), filename=os.path.basename(watchtower.get_database_filepath(db_param)), as_attachment=True)
+    if db_filepath:
+        # conditional=True makes the download resumable (Range/If-Modified-Since) and lets
+        # the WSGI server hand the file off with its file wrapper instead of copying chunks.
+        return send_file(db_filepath, as_attachment=True, attachment_filename=os.path.basename(db_filepath), conditional=True)
     else:
-        return jsonify({'error': f'Database "{db_param}" not found.'})
+        return ojsonify({'error': f'Database "{db_param}" not found.'})
+
+
+# Single dict probe per API call; the if/elif chain compared three strings per route.
+api_routes = {
+    ('v1', 'global-search', 'search'): global_search,
+    ('v1', 'database', 'download'): database_download,
+}